@@ -49,13 +49,12 @@ def sqlmesh_asset_from_multi_asset_options(
     if enabled_subsetting:
         kwargs["can_subset"] = True
 
-    #asset_deps = sqlmesh_multi_asset_options.to_asset_deps()   
-    #print("Asset deps boop:", asset_deps)  # Debugging line
+    outs, deps, internal_asset_deps = sqlmesh_multi_asset_options.materialize()
 
     return multi_asset(
-        outs=sqlmesh_multi_asset_options.to_asset_outs(),
-        deps=sqlmesh_multi_asset_options.to_asset_deps(),
-        internal_asset_deps=sqlmesh_multi_asset_options.to_internal_asset_deps(),
+        outs=outs,
+        deps=deps,
+        internal_asset_deps=internal_asset_deps,
         name=name,
         compute_kind=compute_kind,
         op_tags=op_tags,
@@ -66,7 +66,7 @@ class RunOptions(t.TypedDict):
     no_auto_upstream: t.NotRequired[bool]
 
 
-@dataclass(kw_only=True)
+@dataclass(slots=True, frozen=True, kw_only=True)
 class SQLMeshParsedFQN:
     catalog: str
     schema: str
@@ -74,12 +74,13 @@ class SQLMeshParsedFQN:
 
 
 def parse_fqn(fqn: str) -> SQLMeshParsedFQN:
-    split_fqn = fqn.split(".")
+    catalog, schema, view_name = fqn.split(".", 2)
 
     # Remove any quotes
-    split_fqn = list(map(lambda a: a.strip("'\""), split_fqn))
     return SQLMeshParsedFQN(
-        catalog=split_fqn[0], schema=split_fqn[1], view_name=split_fqn[2]
+        catalog=catalog.strip("'\""),
+        schema=schema.strip("'\""),
+        view_name=view_name.strip("'\""),
     )
 
 
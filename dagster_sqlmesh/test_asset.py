@@ -1,4 +1,5 @@
 from dagster_sqlmesh.conftest import SQLMeshTestContext
+from dagster_sqlmesh.translator import IntermediateAssetOut
 
 
 def test_sqlmesh_context_to_asset_outs(sample_sqlmesh_test_context: SQLMeshTestContext):
@@ -7,3 +8,41 @@ def test_sqlmesh_context_to_asset_outs(sample_sqlmesh_test_context: SQLMeshTestC
     outs = controller.to_asset_outs("dev", translator=translator)
     assert len(list(outs.deps)) == 1
     assert len(outs.outs) == 10
+
+
+def test_sqlmesh_multi_asset_options_materialize(
+    sample_sqlmesh_test_context: SQLMeshTestContext,
+):
+    controller = sample_sqlmesh_test_context.create_controller()
+    translator = sample_sqlmesh_test_context.context_config.get_translator()
+    options = controller.to_asset_outs("dev", translator=translator)
+
+    outs, deps, internal_asset_deps = options.materialize()
+
+    expected_outs = options.to_asset_outs()
+    assert outs.keys() == expected_outs.keys()
+    for name, out in outs.items():
+        expected_out = expected_outs[name]
+        assert out.key == expected_out.key
+        assert out.group_name == expected_out.group_name
+        assert out.tags == expected_out.tags
+        assert out.is_required == expected_out.is_required
+        assert out.kinds == expected_out.kinds
+    assert deps == list(options.to_asset_deps())
+    assert internal_asset_deps == options.to_internal_asset_deps()
+
+    # The internal asset deps reuse the AssetKeys resolved for the outs
+    out_keys = {
+        out.asset_key: outs[name].key
+        for name, out in options.outs.items()
+        if isinstance(out, IntermediateAssetOut)
+    }
+    reused = 0
+    for name, dep_strs in options.internal_asset_deps.items():
+        for dep_str in dep_strs:
+            if dep_str in out_keys:
+                reused += 1
+                assert any(
+                    key is out_keys[dep_str] for key in internal_asset_deps[name]
+                )
+    assert reused
@@ -0,0 +1,87 @@
+import pytest
+from sqlglot import exp
+
+from dagster_sqlmesh.translator import (
+    IntermediateAssetOut,
+    SQLMeshDagsterTranslator,
+    _parse_fqn_parts,
+)
+
+
+@pytest.mark.parametrize(
+    "fqn",
+    [
+        "db.sqlmesh_example.full_model",
+        "Catalog.Schema.Table",
+        '"db"."sqlmesh_example"."full_model"',
+        '"db"."sqlmesh example"."full_model"',
+        '"db"."sqlmesh.example"."full_model"',
+        "sqlmesh_example.full_model",
+    ],
+)
+def test_get_asset_key_name_matches_sqlglot(fqn: str):
+    translator = SQLMeshDagsterTranslator()
+    table = exp.to_table(fqn)
+
+    assert translator.get_asset_key_name(fqn) == [table.catalog, table.db, table.name]
+    assert translator.get_asset_key_str(fqn) == "sqlmesh__" + "_".join(
+        [table.catalog, table.db, table.name]
+    )
+
+
+@pytest.mark.parametrize(
+    "fqn,expected",
+    [
+        ("db.sqlmesh_example.full_model", ["db", "sqlmesh_example", "full_model"]),
+        ('"db"."sqlmesh_example"."full_model"', ["db", "sqlmesh_example", "full_model"]),
+        ('"db"."sqlmesh.example"."full_model"', ["db", "sqlmesh.example", "full_model"]),
+    ],
+)
+def test_get_asset_key_name_fast_path(
+    monkeypatch: pytest.MonkeyPatch, fqn: str, expected: list[str]
+):
+    def fail_to_table(*args: object, **kwargs: object) -> exp.Table:
+        raise AssertionError("sqlglot should not be used for simple fqns")
+
+    _parse_fqn_parts.cache_clear()
+    monkeypatch.setattr(exp, "to_table", fail_to_table)
+
+    assert SQLMeshDagsterTranslator().get_asset_key_name(fqn) == expected
+
+
+def test_create_asset_out_splits_kwargs():
+    translator = SQLMeshDagsterTranslator()
+    kwargs = {
+        "kinds": {"sqlmesh", "duckdb"},
+        "tags": {"tag": ""},
+        "group_name": "sqlmesh_example",
+        "is_required": True,
+        "extra": "value",
+    }
+    kwargs_before = dict(kwargs)
+
+    out = translator.create_asset_out(model_key="model", asset_key="a/b", **kwargs)
+
+    assert isinstance(out, IntermediateAssetOut)
+    assert out.model_key == "model"
+    assert out.asset_key == "a/b"
+    assert out.kinds == {"sqlmesh", "duckdb"}
+    assert out.tags == {"tag": ""}
+    assert out.group_name == "sqlmesh_example"
+    assert out.is_required is True
+    assert out.kwargs == {"extra": "value"}
+    assert kwargs == kwargs_before
+
+    out = translator.create_asset_out(model_key="model", asset_key="a/b", tags={})
+
+    assert isinstance(out, IntermediateAssetOut)
+    assert out.is_required is False
+    assert out.kwargs is None
+
+
+def test_create_asset_dep_returns_key():
+    translator = SQLMeshDagsterTranslator()
+
+    assert translator.create_asset_dep(key="db/sqlmesh_example/external") == (
+        "db/sqlmesh_example/external"
+    )
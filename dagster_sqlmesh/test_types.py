@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+from dagster import AssetDep, AssetKey
+
+from dagster_sqlmesh.types import SQLMeshMultiAssetOptions
+
+
+@dataclass(kw_only=True)
+class CustomAssetDep:
+    key: str
+
+    def to_asset_dep(self) -> AssetDep:
+        return AssetDep(AssetKey([self.key]))
+
+
+def test_to_asset_deps_coerces_deps():
+    options = SQLMeshMultiAssetOptions(
+        deps=[
+            "db/sqlmesh_example/external",
+            AssetKey(["db", "other"]),
+            CustomAssetDep(key="custom"),
+        ]
+    )
+
+    assert list(options.to_asset_deps()) == [
+        AssetDep(AssetKey(["db", "sqlmesh_example", "external"])),
+        AssetDep(AssetKey(["db", "other"])),
+        AssetDep(AssetKey(["custom"])),
+    ]
@@ -1,49 +1,91 @@
+import sys
 import typing as t
 from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
 from inspect import signature
 
-from dagster import AssetDep, AssetKey, AssetOut
-from pydantic import BaseModel, Field
+from dagster import AssetKey, AssetOut
 from sqlglot import exp
 from sqlmesh.core.context import Context
 from sqlmesh.core.model import Model
 
-from .types import ConvertibleToAssetDep, ConvertibleToAssetOut
+from .types import CoercibleToAssetDep, ConvertibleToAssetOut
 
+# Older versions of dagster do not accept `kinds` on AssetOut
+_ASSET_OUT_SUPPORTS_KINDS = "kinds" in signature(AssetOut).parameters
 
-class IntermediateAssetOut(BaseModel):
+# Prefix of the internal asset key strings used to map outputs and deps
+_ASSET_KEY_STR_PREFIX = "sqlmesh__"
+
+# kwargs of `create_asset_out` that map onto IntermediateAssetOut fields
+_ASSET_OUT_FIELD_KWARGS = frozenset(("kinds", "tags", "group_name", "is_required"))
+
+
+@lru_cache(maxsize=4096)
+def _parse_fqn_parts(fqn: str) -> tuple[str, str, str]:
+    """Parse a fully qualified name into its (catalog, db, name) parts.
+
+    The same fqn is parsed several times per model while loading assets, so
+    the result is cached. Fully quoted `"catalog"."db"."name"` triples (the
+    form sqlmesh uses for model fqns) and plain `catalog.db.name` triples made
+    up of simple identifiers skip sqlglot entirely; anything else falls back
+    to the sqlglot parser.
+    """
+    if len(fqn) > 1 and fqn[0] == '"' and fqn[-1] == '"':
+        parts = fqn[1:-1].split('"."')
+        if len(parts) == 3 and all(part and '"' not in part for part in parts):
+            catalog, db, name = parts
+            return (catalog, db, name)
+    else:
+        parts = fqn.split(".", 2)
+        if len(parts) == 3 and all(part.isidentifier() for part in parts):
+            catalog, db, name = parts
+            return (catalog, db, name)
+
+    table = exp.to_table(fqn)
+    return (table.catalog, table.db, table.name)
+
+
+def _asset_key_name(fqn: str) -> list[str]:
+    """Default asset key components [catalog, schema, table] for an fqn."""
+    return list(_parse_fqn_parts(fqn))
+
+
+def _asset_key_str(fqn: str) -> str:
+    """Default internal "sqlmesh__" prefixed asset key string for an fqn.
+
+    The result is interned as it is used as a dictionary key throughout the
+    integration.
+    """
+    return sys.intern(_ASSET_KEY_STR_PREFIX + "_".join(_parse_fqn_parts(fqn)))
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class IntermediateAssetOut:
     model_key: str
     asset_key: str
     tags: t.Mapping[str, str] | None = None
     is_required: bool = True
     group_name: str | None = None
     kinds: set[str] | None = None
-    kwargs: dict[str, t.Any] = Field(default_factory=dict)
+    kwargs: dict[str, t.Any] | None = None
 
     def to_asset_out(self) -> AssetOut:
         asset_key = AssetKey.from_user_string(self.asset_key)
 
-        if "kinds" not in signature(AssetOut).parameters:
-            self.kinds = None
+        kinds = self.kinds if _ASSET_OUT_SUPPORTS_KINDS else None
 
         return AssetOut(
             key=asset_key,
             tags=self.tags,
             is_required=self.is_required,
             group_name=self.group_name,
-            kinds=self.kinds,
-            **self.kwargs,
+            kinds=kinds,
+            **(self.kwargs or {}),
         )
 
 
-class IntermediateAssetDep(BaseModel):
-    key: str
-    kwargs: dict[str, t.Any] = Field(default_factory=dict)
-
-    def to_asset_dep(self) -> AssetDep:
-        return AssetDep(AssetKey.from_user_string(self.key))
-
-
 class SQLMeshDagsterTranslator:
     """Translates SQLMesh objects for Dagster.
     
@@ -77,10 +119,7 @@ class SQLMeshDagsterTranslator:
         Returns:
             Sequence[str]: Asset key components [catalog, schema, table]
         """
-        table = exp.to_table(fqn)
-        asset_key_name = [table.catalog, table.db, table.name]
-
-        return asset_key_name
+        return _asset_key_name(fqn)
 
     def get_group_name(self, context: Context, model: Model) -> str:
         """Get the Dagster asset group name for a SQLMesh model.
@@ -106,20 +145,23 @@ class SQLMeshDagsterTranslator:
         """
         return context.engine_adapter.dialect
 
-    def create_asset_dep(self, *, key: str, **kwargs: t.Any) -> ConvertibleToAssetDep:
+    def create_asset_dep(self, *, key: str, **kwargs: t.Any) -> CoercibleToAssetDep:
         """Create an object that resolves to an AssetDep.
 
-        This creates an intermediate representation that can be converted to a
-        Dagster AssetDep. Most users will not need to use this method directly.
+        The default implementation returns the asset key string itself, which
+        is resolved to an AssetDep when the multi asset is created. Most users
+        will not need to use this method directly.
         
         Args:
             key: The asset key string for the dependency
-            **kwargs: Additional arguments to pass to the AssetDep
+            **kwargs: Additional arguments for custom implementations (unused
+                by default)
             
         Returns:
-            ConvertibleToAssetDep: An object that can be converted to an AssetDep
+            CoercibleToAssetDep: An asset key string, an AssetKey or an object
+                that can be converted to an AssetDep
         """
-        return IntermediateAssetDep(key=key, kwargs=kwargs)
+        return key
 
     def create_asset_out(
         self, *, model_key: str, asset_key: str, **kwargs: t.Any
@@ -137,14 +179,17 @@ class SQLMeshDagsterTranslator:
         Returns:
             ConvertibleToAssetOut: An object that can be converted to an AssetOut
         """
+        extra_kwargs = {
+            k: v for k, v in kwargs.items() if k not in _ASSET_OUT_FIELD_KWARGS
+        }
         return IntermediateAssetOut(
             model_key=model_key,
             asset_key=asset_key,
-            kinds=kwargs.pop("kinds", None),
-            tags=kwargs.pop("tags", None),
-            group_name=kwargs.pop("group_name", None),
-            is_required=kwargs.pop("is_required", False),
-            kwargs=kwargs,
+            kinds=kwargs.get("kinds"),
+            tags=kwargs.get("tags"),
+            group_name=kwargs.get("group_name"),
+            is_required=kwargs.get("is_required", False),
+            kwargs=extra_kwargs or None,
         )
 
     def get_asset_key_str(self, fqn: str) -> str:
@@ -161,10 +206,7 @@ class SQLMeshDagsterTranslator:
         Returns:
             str: Internal asset key string with "sqlmesh__" prefix
         """
-        table = exp.to_table(fqn)
-        asset_key_name = [table.catalog, table.db, table.name]
-        
-        return "sqlmesh__" + "_".join(asset_key_name)
+        return _asset_key_str(fqn)
 
     def get_tags(self, context: Context, model: Model) -> dict[str, str]:
         """Get Dagster asset tags for a SQLMesh model.
@@ -184,4 +226,4 @@ class SQLMeshDagsterTranslator:
             will render tags with empty string values as "labels" rather than
             key-value pairs.
         """
-        return {k: "" for k in model.tags}
+        return dict.fromkeys(model.tags, "")
@@ -7,7 +7,7 @@ from sqlmesh.core.model import Model
 MultiAssetResponse = t.Iterable[AssetCheckResult | AssetMaterialization]
 
 
-@dataclass(kw_only=True)
+@dataclass(slots=True, frozen=True, kw_only=True)
 class SQLMeshParsedFQN:
     catalog: str
     schema: str
@@ -15,11 +15,14 @@ class SQLMeshParsedFQN:
 
     @classmethod
     def parse(cls, fqn: str) -> "SQLMeshParsedFQN":
-        split_fqn = fqn.split(".")
+        catalog, schema, view_name = fqn.split(".", 2)
 
         # Remove any quotes
-        split_fqn = list(map(lambda a: a.strip("'\""), split_fqn))
-        return cls(catalog=split_fqn[0], schema=split_fqn[1], view_name=split_fqn[2])
+        return cls(
+            catalog=catalog.strip("'\""),
+            schema=schema.strip("'\""),
+            view_name=view_name.strip("'\""),
+        )
 
 
 @dataclass(kw_only=True)
@@ -44,6 +47,27 @@ class ConvertibleToAssetKey(t.Protocol):
     def to_asset_key(self) -> AssetKey:
         ...
 
+# An external dependency is either an asset key string, an AssetKey or an
+# object that knows how to convert itself to an AssetDep
+CoercibleToAssetDep = ConvertibleToAssetDep | AssetKey | str
+
+class _AssetKeyCache(dict[str, AssetKey]):
+    """Memoizes `AssetKey.from_user_string` for asset key strings that are
+    referenced many times (e.g. an upstream shared by many downstreams)."""
+
+    def __missing__(self, key: str) -> AssetKey:
+        asset_key = self[key] = AssetKey.from_user_string(key)
+        return asset_key
+
+
+def _to_asset_dep(dep: CoercibleToAssetDep, key_cache: _AssetKeyCache) -> AssetDep:
+    if isinstance(dep, str):
+        return AssetDep(key_cache[dep])
+    if isinstance(dep, AssetKey):
+        return AssetDep(dep)
+    return dep.to_asset_dep()
+
+
 @dataclass(kw_only=True)
 class SQLMeshMultiAssetOptions:
     """Generic class for returning dagster multi asset options from SQLMesh, the
@@ -53,7 +77,7 @@ class SQLMeshMultiAssetOptions:
     manipulate the dagster asset creation process as they see fit."""
 
     outs: t.Mapping[str, ConvertibleToAssetOut] = field(default_factory=lambda: {})
-    deps: t.Iterable[ConvertibleToAssetDep] = field(default_factory=lambda: [])
+    deps: t.Iterable[CoercibleToAssetDep] = field(default_factory=lambda: [])
     internal_asset_deps: t.Mapping[str, set[str]] = field(default_factory=lambda: {})
 
     def to_asset_outs(self) -> t.Mapping[str, AssetOut]:
@@ -62,11 +86,42 @@ class SQLMeshMultiAssetOptions:
 
     def to_asset_deps(self) -> t.Iterable[AssetDep]:
         """Convert to an iterable of AssetDep objects."""
-        return [dep.to_asset_dep() for dep in self.deps]
+        return self._to_asset_deps(_AssetKeyCache())
     
     def to_internal_asset_deps(self) -> dict[str, set[AssetKey]]:
         """Convert to a dictionary of internal asset dependencies."""
+        return self._to_internal_asset_deps(_AssetKeyCache())
+
+    def materialize(
+        self,
+    ) -> tuple[t.Mapping[str, AssetOut], list[AssetDep], dict[str, set[AssetKey]]]:
+        """Convert the outs, deps and internal asset deps in one go.
+
+        Asset key strings are only parsed once across the deps and internal
+        asset deps. The AssetKeys resolved for `IntermediateAssetOut` outs are
+        reused as well, since those are parsed from a known key string."""
+        # Imported here as the translator module depends on this module
+        from .translator import IntermediateAssetOut
+
+        key_cache = _AssetKeyCache()
+        asset_outs = self.to_asset_outs()
+        asset_deps = self._to_asset_deps(key_cache)
+
+        for name, out in self.outs.items():
+            asset_key = asset_outs[name].key
+            if isinstance(out, IntermediateAssetOut) and asset_key is not None:
+                key_cache[out.asset_key] = asset_key
+
+        return asset_outs, asset_deps, self._to_internal_asset_deps(key_cache)
+
+    def _to_asset_deps(self, key_cache: _AssetKeyCache) -> list[AssetDep]:
+        return [_to_asset_dep(dep, key_cache) for dep in self.deps]
+
+    def _to_internal_asset_deps(
+        self, key_cache: _AssetKeyCache
+    ) -> dict[str, set[AssetKey]]:
+        get_asset_key = key_cache.__getitem__
         return {
-            key: {AssetKey.from_user_string(dep) for dep in deps}
+            key: set(map(get_asset_key, deps))
             for key, deps in self.internal_asset_deps.items()
         }
\ No newline at end of file